@@ -6,4 +6,4 @@ if __name__ == '__main__':
     # Inject the --gui flag if it's not already present
     if '--gui' not in sys.argv:
         sys.argv.append('--gui')
-    main()
+    sys.exit(main())
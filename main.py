@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import sys
 from photo_date_changer.cli import main
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""BatchRunner: run many OperationRunner jobs from one manifest in a single process."""
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from .runner import OperationRunner
+from .verify import Verifier
+
+# manifest field -> type; names match OperationRunner.run parameters
+JOB_FIELDS = {
+    "folder": str,
+    "replacement_datetime": datetime,
+    "increment_seconds": int,
+    "no_increment": bool,
+    "recursive": bool,
+    "sort_by": str,
+    "mode": str,
+    "dry_run": bool,
+    "yes": bool,
+}
+JOB_DEFAULTS = {
+    "increment_seconds": 1,
+    "no_increment": False,
+    "recursive": False,
+    "sort_by": "name",
+    "mode": "increment",
+    "dry_run": False,
+    "yes": False,
+}
+
+
+TRUE_STRINGS = ("1", "true", "yes", "y")
+FALSE_STRINGS = ("0", "false", "no", "n")
+
+
+def _coerce(field: str, value):
+    """Convert a manifest value to the field's type. Raises ValueError if it cannot."""
+    kind = JOB_FIELDS[field]
+    if isinstance(value, datetime) and kind is datetime:
+        return value
+    if value is None or not isinstance(value, (str, int, float)):
+        raise ValueError(f"invalid {field}: {value!r}")
+    if kind is datetime:
+        return datetime.strptime(str(value).strip(), "%Y:%m:%d %H:%M:%S")
+    if kind is bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in TRUE_STRINGS:
+            return True
+        if text in FALSE_STRINGS:
+            return False
+        raise ValueError(f"invalid {field}: {value!r} (use true/false)")
+    if kind is int:
+        if isinstance(value, bool):
+            raise ValueError(f"invalid {field}: {value!r}")
+        return int(value)
+    return str(value)
+
+
+def _norm_folder(path: str) -> str:
+    return os.path.normcase(os.path.realpath(os.path.abspath(path)))
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """True if one folder contains (or is) the other."""
+    a, b = _norm_folder(a), _norm_folder(b)
+    try:
+        return os.path.commonpath([a, b]) in (a, b)
+    except ValueError:  # different drives on Windows
+        return False
+
+
+class BatchRunner:
+    """
+    Execute a list of jobs with one shared OperationRunner (and its original-time cache)
+    and one thread pool. While a job is writing, the next job's discovery runs in the pool.
+    """
+
+    def __init__(self, runner: OperationRunner = None, verifier: Verifier = None):
+        self.runner = runner or OperationRunner()
+        self.verifier = verifier or Verifier(self.runner.exif)
+
+    @staticmethod
+    def load_manifest(path: str) -> List[dict]:
+        """Read raw job entries from a JSON list (or {"jobs": [...]}) or a CSV with a header row."""
+        if path.lower().endswith(".csv"):
+            with open(path, "r", encoding="utf-8-sig", newline="") as fh:
+                rows = list(csv.DictReader(fh))
+            for line, row in enumerate(rows, start=2):
+                if None in row:
+                    raise ValueError(f"line {line} has more columns than the header")
+            return [{k: v for k, v in row.items() if v not in (None, "")} for row in rows]
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if isinstance(data, dict):
+            if "jobs" not in data:
+                raise ValueError("manifest object has no 'jobs' list")
+            entries = data["jobs"]
+        else:
+            entries = data
+        if not isinstance(entries, list) or not all(isinstance(e, dict) for e in entries):
+            raise ValueError("expected a list of job objects")
+        return entries
+
+    @staticmethod
+    def parse_job(entry: dict, defaults: Optional[dict] = None, overrides: Optional[dict] = None) -> dict:
+        """
+        Normalize one manifest entry to OperationRunner.run kwargs. Entry values win over
+        defaults; overrides win over both. Raises ValueError if invalid.
+        """
+        entry = dict(entry)
+        if "datetime" in entry:
+            entry.setdefault("replacement_datetime", entry.pop("datetime"))
+        unknown = set(entry) - set(JOB_FIELDS) - {"name"}
+        if unknown:
+            raise ValueError(f"unknown field(s): {', '.join(sorted(unknown))}")
+        job = dict(JOB_DEFAULTS)
+        job.update(defaults or {})
+        for field, value in entry.items():
+            if field != "name":
+                job[field] = _coerce(field, value)
+        job.update(overrides or {})
+        if "folder" not in job:
+            raise ValueError("missing 'folder'")
+        if "replacement_datetime" not in job:
+            raise ValueError("missing 'datetime'")
+        if job["sort_by"] not in ("name", "mtime"):
+            raise ValueError(f"invalid sort_by: {job['sort_by']}")
+        if job["mode"] not in ("increment", "align-earliest"):
+            raise ValueError(f"invalid mode: {job['mode']}")
+        return job
+
+    def run(
+        self,
+        entries: List[dict],
+        defaults: Optional[dict] = None,
+        overrides: Optional[dict] = None,
+        workers: Optional[int] = None,
+        verify: bool = False,
+        verify_sample: Optional[int] = None,
+        log_fn: Callable = print,
+    ) -> List[dict]:
+        """
+        Run every entry in order and return one result dict per job with keys
+        name, status, files, seconds, error and mismatches.
+        """
+        results = []
+        jobs = []
+        for entry in entries:
+            result = {"name": "?", "status": "ok", "files": 0, "seconds": 0.0, "error": "", "mismatches": []}
+            try:
+                if not isinstance(entry, dict):
+                    raise ValueError("job must be an object")
+                result["name"] = str(entry.get("name") or entry.get("folder") or "?")
+                jobs.append(self.parse_job(entry, defaults, overrides))
+            except ValueError as e:
+                jobs.append(None)
+                result.update(status="invalid", error=str(e))
+            results.append(result)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending: Dict[int, object] = {}
+
+            def prefetch(i):
+                if i < len(jobs) and jobs[i] is not None and i not in pending:
+                    j = jobs[i]
+                    pending[i] = pool.submit(self.runner.discover, j["folder"], j["recursive"], j["sort_by"], j["mode"])
+
+            def next_valid(i):
+                i += 1
+                while i < len(jobs) and jobs[i] is None:
+                    i += 1
+                return i
+
+            prefetch(next_valid(-1))
+            for idx, (job, result) in enumerate(zip(jobs, results)):
+                if job is None:
+                    log_fn(f"\n=== Job {idx + 1}/{len(jobs)}: {result['name']} ===\n❌ Invalid job: {result['error']}")
+                    continue
+                log_fn(f"\n=== Job {idx + 1}/{len(jobs)}: {result['name']} ===")
+                started = time.perf_counter()
+                try:
+                    prefetch(idx)
+                    files = pending.pop(idx).result()
+                    nxt = next_valid(idx)
+                    # discovery of a folder that this job writes to would see stale times
+                    if nxt < len(jobs) and not _overlaps(job["folder"], jobs[nxt]["folder"]):
+                        prefetch(nxt)
+                    if not os.path.isdir(job["folder"]):
+                        raise FileNotFoundError(f"folder not found: {job['folder']}")
+                    targets = self.runner.run(**job, log_fn=log_fn, files=files)
+                    if not targets:
+                        result["status"] = "skipped"
+                    elif job["dry_run"]:
+                        result.update(status="dry-run", files=len(targets))
+                    else:
+                        result["files"] = len(targets)
+                        if verify:
+                            mismatches = self.verifier.verify(targets, sample=verify_sample, executor=pool, log_fn=log_fn)
+                            if mismatches:
+                                result.update(status="mismatch", mismatches=mismatches)
+                except Exception as e:
+                    result.update(status="error", error=str(e))
+                    log_fn(f"❌ Job error: {e}")
+                result["seconds"] = time.perf_counter() - started
+        return results
+
+    @staticmethod
+    def format_summary(results: List[dict], total_seconds: float) -> str:
+        icons = {"ok": "✅", "dry-run": "🔍", "skipped": "⏭️", "mismatch": "❌", "error": "❌", "invalid": "❌"}
+        lines = [f"Batch summary: {len(results)} job(s) in {total_seconds:.2f}s"]
+        for r in results:
+            line = f"  {icons.get(r['status'], '?')} {r['status']:<8} {r['files']:>6} file(s) {r['seconds']:>8.2f}s  {r['name']}"
+            if r["error"]:
+                line += f"  ({r['error']})"
+            elif r["mismatches"]:
+                line += f"  ({len({m['path'] for m in r['mismatches']})} file(s) mismatched)"
+            lines.append(line)
+        return "\n".join(lines)
+
+    @staticmethod
+    def failed(results: List[dict]) -> bool:
+        return any(r["status"] in ("mismatch", "error", "invalid") for r in results)
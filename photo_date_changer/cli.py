@@ -1,9 +1,13 @@
 """CLI entrypoint and argument parsing."""
 import argparse
+import os
+import time
 from datetime import datetime
 import tkinter as tk
 
 from .runner import OperationRunner
+from .verify import Verifier
+from .batch import BatchRunner
 from .gui import APP_VERSION
 
 DEFAULT_FOLDER = "./"
@@ -12,6 +16,12 @@ DEFAULT_INCREMENT_SECONDS = 1
 DEFAULT_SORT_BY = "name"
 DEFAULT_MODE = "increment"
 
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return n
+
 def parse_args():
     p = argparse.ArgumentParser(description="Update EXIF (JPEG) and filesystem timestamps (CLI + GUI).")
     p.add_argument("--folder", "-f", default=DEFAULT_FOLDER, help="Folder containing files")
@@ -24,8 +34,58 @@ def parse_args():
     p.add_argument("--yes", "-y", action="store_true", help="Skip confirmation prompt")
     p.add_argument("--dry-run", action="store_true", help="Preview changes without modifying files")
     p.add_argument("--gui", action="store_true", help="Launch Tkinter GUI")
+    p.add_argument("--journal", help="Write intended targets of this run to a JSON journal")
+    p.add_argument("--verify", action="store_true", help="Re-read written files after the run and compare to targets")
+    p.add_argument("--verify-journal", metavar="JOURNAL", help="Only verify files listed in an existing journal, then exit")
+    p.add_argument("--verify-sample", type=positive_int, help="Verify a random sample of N files instead of all")
+    p.add_argument("--verify-workers", type=positive_int, help="Worker threads used for verification")
+    p.add_argument("--verify-report", help="Write mismatch report (TSV) to this path")
+    p.add_argument("--batch", metavar="MANIFEST", help="Run every job in a JSON or CSV manifest in one process")
+    p.add_argument("--batch-workers", type=positive_int, help="Worker threads shared by batch discovery and verification")
     return p.parse_args()
 
+def run_verification(args, targets) -> int:
+    """Verify targets, write/print the mismatch report and return the exit code."""
+    mismatches = Verifier().verify(targets, sample=args.verify_sample, workers=args.verify_workers, log_fn=print)
+    # always rewrite the report so a passing run does not leave a stale one behind
+    if args.verify_report:
+        Verifier.write_report(args.verify_report, mismatches)
+        print(f"Mismatch report written to {args.verify_report}")
+    elif mismatches:
+        print(Verifier.format_report(mismatches), end="")
+    return 1 if mismatches else 0
+
+def run_batch(args) -> int:
+    """Run a batch manifest, print the combined summary and return the exit code."""
+    try:
+        entries = BatchRunner.load_manifest(args.batch)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read batch manifest {args.batch}: {e}")
+        return 2
+    # --yes applies to jobs that do not set "yes"; --dry-run is forced on every job
+    defaults = {"yes": args.yes}
+    overrides = {"dry_run": True} if args.dry_run else None
+    started = time.perf_counter()
+    batch = BatchRunner()
+    results = batch.run(
+        entries,
+        defaults=defaults,
+        overrides=overrides,
+        workers=args.batch_workers,
+        verify=args.verify,
+        verify_sample=args.verify_sample,
+        log_fn=print,
+    )
+    print()
+    print(BatchRunner.format_summary(results, time.perf_counter() - started))
+    mismatches = [m for r in results for m in r["mismatches"]]
+    if args.verify and args.verify_report:
+        Verifier.write_report(args.verify_report, mismatches)
+        print(f"Mismatch report written to {args.verify_report}")
+    elif mismatches:
+        print(Verifier.format_report(mismatches), end="")
+    return 1 if BatchRunner.failed(results) else 0
+
 def main():
     args = parse_args()
     print("---------------------------------------------")
@@ -38,16 +98,31 @@ def main():
         root.minsize(720, 620)
         AppGUI(root)
         root.mainloop()
-        return
+        return 0
+
+    if args.verify_journal:
+        try:
+            targets = Verifier.load_journal(args.verify_journal)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ Could not read journal {args.verify_journal}: {e}")
+            return 2
+        return run_verification(args, targets)
+
+    if args.batch:
+        if args.journal:
+            print("Note: --journal has no effect with --batch; no journal will be written.")
+        if args.verify_workers:
+            print("Note: --verify-workers has no effect with --batch; use --batch-workers.")
+        return run_batch(args)
 
     try:
         replacement_datetime = datetime.strptime(args.datetime, "%Y:%m:%d %H:%M:%S")
     except ValueError:
         print("Invalid datetime format. Use: YYYY:MM:DD HH:MM:SS")
-        return
+        return 2
 
     runner = OperationRunner()
-    runner.run(
+    targets = runner.run(
         folder=args.folder,
         replacement_datetime=replacement_datetime,
         increment_seconds=args.increment_seconds,
@@ -59,3 +134,20 @@ def main():
         yes=args.yes,
         log_fn=print
     )
+    if not targets:
+        # a missing folder must fail a verified run; "no files found" is not an error
+        if args.verify and not os.path.isdir(args.folder):
+            return 1
+        return 0
+    if args.journal:
+        if args.dry_run:
+            print("Skipping journal: dry-run made no changes.")
+        else:
+            Verifier.write_journal(args.journal, targets)
+            print(f"Journal written to {args.journal}")
+    if args.verify:
+        if args.dry_run:
+            print("Skipping verification: dry-run made no changes.")
+            return 0
+        return run_verification(args, targets)
+    return 0
@@ -28,6 +28,34 @@ class ExifHandler:
         except Exception:
             return None
 
+    @staticmethod
+    def read_exif_datetimes(path: str) -> dict:
+        """
+        Return {tag name: datetime or None} for DateTimeOriginal, DateTimeDigitized
+        and DateTime. Image.open only parses the header, so pixel data is never decoded.
+        """
+        result = {"DateTimeOriginal": None, "DateTimeDigitized": None, "DateTime": None}
+        with Image.open(path) as img:
+            exif_bytes = img.info.get("exif", b"")
+        if not exif_bytes:
+            return result
+        exif = piexif.load(exif_bytes)
+        raw = {
+            "DateTimeOriginal": exif.get("Exif", {}).get(piexif.ExifIFD.DateTimeOriginal),
+            "DateTimeDigitized": exif.get("Exif", {}).get(piexif.ExifIFD.DateTimeDigitized),
+            "DateTime": exif.get("0th", {}).get(piexif.ImageIFD.DateTime),
+        }
+        for tag, val in raw.items():
+            if not val:
+                continue
+            if isinstance(val, (bytes, bytearray)):
+                val = val.decode("utf-8", errors="ignore")
+            try:
+                result[tag] = ExifHandler.parse_exif_datetime_str(val)
+            except ValueError:
+                pass
+        return result
+
     @staticmethod
     def update_exif_date(image_path: str, dt: datetime, dry_run: bool=False, log_fn=print):
         if dry_run:
@@ -2,14 +2,45 @@
 import os
 import threading
 from datetime import timedelta
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional
 from .file_ops import FileTimestampManager
 from .exif_utils import ExifHandler
 
 class OperationRunner:
-    def __init__(self, file_mgr: FileTimestampManager = None, exif: ExifHandler = None):
+    def __init__(self, file_mgr: FileTimestampManager = None, exif: ExifHandler = None, time_cache: Dict = None):
         self.file_mgr = file_mgr or FileTimestampManager()
         self.exif = exif or ExifHandler()
+        # normalized path -> original datetime; may be shared between runners/jobs
+        self.time_cache = time_cache if time_cache is not None else {}
+
+    @staticmethod
+    def _cache_key(path: str) -> str:
+        # different spellings of the same file must share one entry
+        return os.path.normcase(os.path.abspath(path))
+
+    def original_time(self, path: str):
+        """Cached FileTimestampManager.get_original_time."""
+        key = self._cache_key(path)
+        dt = self.time_cache.get(key)
+        if dt is None:
+            dt = self.file_mgr.get_original_time(path)
+            self.time_cache[key] = dt
+        return dt
+
+    def discover(self, folder: str, recursive: bool = False, sort_by: str = "name", mode: str = "increment") -> List[str]:
+        """Gather and sort the files a run would process (empty if the folder is missing)."""
+        if not os.path.isdir(folder):
+            return []
+        files = self.file_mgr.gather_files(folder, recursive)
+        files = [f for f in files if os.path.isfile(f)]
+        if mode == "increment":
+            if sort_by == "name":
+                files.sort(key=lambda p: os.path.basename(p).lower())
+            else:
+                files.sort(key=lambda p: os.path.getmtime(p))
+        else:
+            files.sort(key=self.original_time)
+        return files
 
     def run(
         self,
@@ -26,30 +57,25 @@ class OperationRunner:
         confirm_fn: Callable = None,
         progress_fn: Callable = None,
         cancel_event: Optional[threading.Event] = None,  # <-- supports cooperative cancellation
+        files: Optional[List[str]] = None,  # pre-discovered files (see discover())
     ):
         """
         Perform the operation. If cancel_event is provided and set at any time,
         the runner will stop cleanly between files.
+
+        Returns {path: target datetime} for every file processed (partial if
+        canceled mid-run), or None if nothing was attempted.
         """
         if not os.path.isdir(folder):
             log_fn(f"❌ Folder not found: {folder}")
             return
 
-        files = self.file_mgr.gather_files(folder, recursive)
-        files = [f for f in files if os.path.isfile(f)]
+        if files is None:
+            files = self.discover(folder, recursive, sort_by, mode)
         if not files:
             log_fn(f"No files found in {folder}")
             return
 
-        # sorting
-        if mode == "increment":
-            if sort_by == "name":
-                files.sort(key=lambda p: os.path.basename(p).lower())
-            else:
-                files.sort(key=lambda p: os.path.getmtime(p))
-        else:
-            files.sort(key=lambda p: self.file_mgr.get_original_time(p))
-
         log_fn(f"Found {len(files)} file(s) in `{folder}` (recursive={recursive}).")
         log_fn("First 10 files:")
         for p in files[:10]:
@@ -74,34 +100,43 @@ class OperationRunner:
 
         # apply updates
         if mode == "align-earliest":
-            orig_times = {f: self.file_mgr.get_original_time(f) for f in files}
+            orig_times = {f: self.original_time(f) for f in files}
             earliest_file, earliest_time = min(orig_times.items(), key=lambda kv: kv[1])
             offset = replacement_datetime - earliest_time
             log_fn(f"Earliest file: {os.path.relpath(earliest_file, folder)} (original: {earliest_time})")
             log_fn(f"Applying offset of {offset} to all files.\n")
+            targets = {}
             for idx, f in enumerate(files):
                 # cooperative cancellation check
                 if cancel_event and cancel_event.is_set():
                     log_fn("🛑 Operation canceled by user.")
-                    return
+                    return targets
                 orig = orig_times[f]
                 new_dt = orig + offset
                 if f.lower().endswith((".jpg", ".jpeg")):
                     self.exif.update_exif_date(f, new_dt, dry_run=dry_run, log_fn=log_fn)
                 self.file_mgr.update_file_timestamp(f, new_dt, dry_run=dry_run, log_fn=log_fn)
+                targets[f] = new_dt
+                if not dry_run:
+                    self.time_cache.pop(self._cache_key(f), None)
                 if progress_fn:
                     progress_fn(idx + 1, len(files))
         else:
+            targets = {}
             for idx, filepath in enumerate(files):
                 # cooperative cancellation check
                 if cancel_event and cancel_event.is_set():
                     log_fn("🛑 Operation canceled by user.")
-                    return
+                    return targets
                 dt = replacement_datetime if no_increment else replacement_datetime + timedelta(seconds=(idx * increment_seconds))
                 if filepath.lower().endswith((".jpg", ".jpeg")):
                     self.exif.update_exif_date(filepath, dt, dry_run=dry_run, log_fn=log_fn)
                 self.file_mgr.update_file_timestamp(filepath, dt, dry_run=dry_run, log_fn=log_fn)
+                targets[filepath] = dt
+                if not dry_run:
+                    self.time_cache.pop(self._cache_key(filepath), None)
                 if progress_fn:
                     progress_fn(idx + 1, len(files))
 
         log_fn("\n✅ Done." if not dry_run else "\n🔍 Dry-run complete. No files modified.")
+        return targets
@@ -0,0 +1,105 @@
+"""Post-write verification: journal I/O, parallel re-read, mismatch report."""
+import json
+import os
+import random
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+from .exif_utils import ExifHandler
+
+JOURNAL_VERSION = 1
+MTIME_TOLERANCE_SECONDS = 1.0
+EXIF_TAGS = ("DateTimeOriginal", "DateTimeDigitized", "DateTime")
+
+
+class Verifier:
+    """Re-read written files and compare them against their intended targets."""
+
+    def __init__(self, exif: ExifHandler = None):
+        self.exif = exif or ExifHandler()
+
+    @staticmethod
+    def write_journal(path: str, targets: Dict[str, datetime]):
+        entries = [{"path": os.path.abspath(p), "target": dt.isoformat()} for p, dt in targets.items()]
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"version": JOURNAL_VERSION, "entries": entries}, fh, indent=2)
+
+    @staticmethod
+    def load_journal(path: str) -> Dict[str, datetime]:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        entries = data.get("entries") if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            raise ValueError("expected a list of journal entries")
+        for e in entries:
+            if not (isinstance(e, dict) and isinstance(e.get("path"), str) and isinstance(e.get("target"), str)):
+                raise ValueError(f"invalid journal entry: {e!r}")
+        return {e["path"]: datetime.fromisoformat(e["target"]) for e in entries}
+
+    def check_file(self, path: str, target: datetime) -> List[dict]:
+        """Return one mismatch dict per field that does not match target (empty if all match)."""
+        if not os.path.isfile(path):
+            return [{"path": path, "field": "file", "expected": str(target), "actual": "missing"}]
+        mismatches = []
+        actual_mtime = datetime.fromtimestamp(os.path.getmtime(path))
+        if abs((actual_mtime - target).total_seconds()) > MTIME_TOLERANCE_SECONDS:
+            mismatches.append({"path": path, "field": "mtime", "expected": str(target), "actual": str(actual_mtime)})
+        if path.lower().endswith((".jpg", ".jpeg")):
+            # EXIF strings have whole-second resolution
+            expected = target.replace(microsecond=0)
+            try:
+                actual = self.exif.read_exif_datetimes(path)
+            except Exception as e:
+                return mismatches + [{"path": path, "field": "exif", "expected": str(expected), "actual": f"unreadable ({e})"}]
+            for tag in EXIF_TAGS:
+                if actual.get(tag) != expected:
+                    mismatches.append({"path": path, "field": tag, "expected": str(expected), "actual": str(actual.get(tag))})
+        return mismatches
+
+    def verify(
+        self,
+        targets: Dict[str, datetime],
+        sample: Optional[int] = None,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        log_fn: Callable = print,
+    ) -> List[dict]:
+        """
+        Check every file in targets (or a random sample of `sample` files) in parallel.
+        Uses the given executor if provided, otherwise a private thread pool.
+        """
+        if sample is not None and sample < 1:
+            raise ValueError(f"sample must be a positive integer, got {sample}")
+        paths = list(targets)
+        if sample is not None and sample < len(paths):
+            paths = random.sample(paths, sample)
+        log_fn(f"🔎 Verifying {len(paths)} of {len(targets)} file(s)...")
+
+        def _check_all(pool):
+            return list(pool.map(lambda p: self.check_file(p, targets[p]), paths))
+
+        if executor is not None:
+            results = _check_all(executor)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = _check_all(pool)
+
+        mismatches = [m for file_mismatches in results for m in file_mismatches]
+        bad_files = len({m["path"] for m in mismatches})
+        if mismatches:
+            log_fn(f"❌ Verification failed: {bad_files} of {len(paths)} file(s) mismatched.")
+        else:
+            log_fn(f"✅ Verification passed: {len(paths)} file(s) match.")
+        return mismatches
+
+    @staticmethod
+    def format_report(mismatches: List[dict]) -> str:
+        lines = ["path\tfield\texpected\tactual"]
+        for m in mismatches:
+            lines.append(f"{m['path']}\t{m['field']}\t{m['expected']}\t{m['actual']}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def write_report(path: str, mismatches: List[dict]):
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(Verifier.format_report(mismatches))